@@ -17,23 +17,115 @@ Date: December 2025
 import geopandas as gpd
 import pandas as pd
 import numpy as np
+import glob
+import hashlib
 import os
+import re
+import shapely
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import PolyCollection
 from matplotlib.colors import LinearSegmentedColormap
+from rasterio.features import rasterize
+from rasterio.transform import from_bounds
 import warnings
 
 warnings.filterwarnings("ignore")
 
 
+def mortality_scores(cells, mortality_areas, mortality):
+    """Area-weighted mean mortality of the mortality areas overlapping each cell."""
+    # One row per overlapping (cell, mortality area) pair
+    overlaps = gpd.overlay(
+        gpd.GeoDataFrame({"cell": np.arange(len(cells))}, geometry=cells),
+        gpd.GeoDataFrame({"mortality": mortality}, geometry=mortality_areas),
+        how="intersection",
+        keep_geom_type=True,
+    )
+
+    # Calculate area-weighted mortality
+    cell_idx = overlaps["cell"].to_numpy()
+    intersection_area = overlaps.geometry.area.to_numpy()
+    weighted = np.bincount(
+        cell_idx,
+        weights=overlaps["mortality"].to_numpy() * intersection_area,
+        minlength=len(cells),
+    )
+    total_area = np.bincount(cell_idx, weights=intersection_area, minlength=len(cells))
+
+    return np.divide(
+        weighted, total_area, out=np.zeros(len(cells)), where=total_area > 0
+    )
+
+
+def proximity_scores(cells, features, importance, inner, outer):
+    """Score cells by distance to the features of a layer.
+
+    A feature scores its full importance at zero distance, decaying linearly
+    to 0 at `inner` meters, then half its importance decaying to 0 between
+    `inner` and `outer` meters. Each cell keeps its highest feature score.
+    """
+    # Every (cell, feature) pair within the outer buffer
+    cell_idx, feature_idx = shapely.STRtree(features).query(
+        cells, predicate="dwithin", distance=outer
+    )
+
+    # Pairs that intersect are at distance 0 and score full importance, so the
+    # exact distance is only computed for the pairs that do not touch
+    shapely.prepare(cells)
+    apart = ~shapely.intersects(cells[cell_idx], features[feature_idx])
+    distance = np.zeros(len(cell_idx))
+    distance[apart] = shapely.distance(
+        cells[cell_idx[apart]], features[feature_idx[apart]]
+    )
+
+    # Pairs are all within `outer`, so only the two decaying tiers remain
+    score = np.where(
+        distance < inner,
+        1 - distance / inner,
+        0.5 * (1 - (distance - inner) / (outer - inner)),
+    )
+    score *= importance[feature_idx]
+
+    # Per-cell max over contiguous (CSR-style) runs of each cell's pairs
+    scores = np.zeros(len(cells))
+    if len(score) > 0:
+        order = np.argsort(cell_idx, kind="stable")
+        cell_idx, score = cell_idx[order], score[order]
+        starts = np.flatnonzero(np.r_[True, cell_idx[1:] != cell_idx[:-1]])
+        scores[cell_idx[starts]] = np.maximum(np.maximum.reduceat(score, starts), 0)
+    return scores
+
+
+def population_scores(cells, areas, pop_density):
+    """Sum of population density weighted by the share of each cell covered."""
+    # Every overlapping (cell, populated area) pair. The few large areas are
+    # prepared once and used as query geometries against a tree of cells,
+    # so the intersects predicate runs on the prepared side.
+    shapely.prepare(areas)
+    area_idx, cell_idx = shapely.STRtree(cells).query(areas, predicate="intersects")
+    intersection = shapely.intersection(cells[cell_idx], areas[area_idx])
+    ratio = shapely.area(intersection) / shapely.area(cells[cell_idx])
+
+    return np.bincount(
+        cell_idx, weights=ratio * pop_density[area_idx], minlength=len(cells)
+    )
+
+
 class FireCreekAnalysis:
     """Main analysis class for Fire Creek tree cutting priority."""
 
-    def __init__(self, data_dir, output_dir):
+    def __init__(self, data_dir, output_dir, cache_dir=None):
         self.data_dir = data_dir
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
 
+        # GeoParquet cache of loaded, reprojected layers (disabled when None)
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
         # Data layers
         self.cutting_grid = None
         self.tree_mortality = None
@@ -68,99 +160,97 @@ class FireCreekAnalysis:
 
         try:
             # Load cutting grid
-            self.cutting_grid = gpd.read_file(
-                os.path.join(self.data_dir, "CuttingGrids.shp")
-            )
+            self.cutting_grid = self._read_layer("CuttingGrids.shp")
             print(f"✓ Cutting Grid: {len(self.cutting_grid)} cells loaded")
 
+            # All other layers are reprojected to the cutting grid CRS
+            crs = self.cutting_grid.crs
+
             # Load tree mortality
-            self.tree_mortality = gpd.read_file(
-                os.path.join(self.data_dir, "SBNFMortalityt.shp")
-            )
+            self.tree_mortality = self._read_layer("SBNFMortalityt.shp", crs)
             print(f"✓ Tree Mortality: {len(self.tree_mortality)} features loaded")
 
             # Load community features
-            self.community_features = gpd.read_file(
-                os.path.join(self.data_dir, "Communityfeatures.shp")
-            )
+            self.community_features = self._read_layer("Communityfeatures.shp", crs)
             print(
                 f"✓ Community Features: {len(self.community_features)} features loaded"
             )
 
             # Load egress routes
-            self.egress_routes = gpd.read_file(
-                os.path.join(self.data_dir, "EgressRoutes.shp")
-            )
+            self.egress_routes = self._read_layer("EgressRoutes.shp", crs)
             print(f"✓ Egress Routes: {len(self.egress_routes)} routes loaded")
 
             # Load populated areas
-            self.populated_areas = gpd.read_file(
-                os.path.join(self.data_dir, "PopulatedAreast.shp")
-            )
+            self.populated_areas = self._read_layer("PopulatedAreast.shp", crs)
             print(f"✓ Populated Areas: {len(self.populated_areas)} areas loaded")
 
             # Load electric utilities
-            self.transmission = gpd.read_file(
-                os.path.join(self.data_dir, "Transmission.shp")
-            )
+            self.transmission = self._read_layer("Transmission.shp", crs)
             print(f"✓ Transmission Lines: {len(self.transmission)} lines loaded")
 
-            self.sub_transmission = gpd.read_file(
-                os.path.join(self.data_dir, "SubTransmission.shp")
-            )
+            self.sub_transmission = self._read_layer("SubTransmission.shp", crs)
             print(
                 f"✓ Sub-Transmission Lines: {len(self.sub_transmission)} lines loaded"
             )
 
-            self.dist_circuits = gpd.read_file(
-                os.path.join(self.data_dir, "DistCircuits.shp")
-            )
+            self.dist_circuits = self._read_layer("DistCircuits.shp", crs)
             print(f"✓ Distribution Circuits: {len(self.dist_circuits)} circuits loaded")
 
-            self.substations = gpd.read_file(
-                os.path.join(self.data_dir, "Substations.shp")
-            )
+            self.substations = self._read_layer("Substations.shp", crs)
             print(f"✓ Substations: {len(self.substations)} substations loaded")
 
-            self.pole_top_subs = gpd.read_file(
-                os.path.join(self.data_dir, "PoleTopSubs.shp")
-            )
+            self.pole_top_subs = self._read_layer("PoleTopSubs.shp", crs)
             print(f"✓ Pole-Top Substations: {len(self.pole_top_subs)} units loaded")
 
-            # Ensure all layers have the same CRS
-            self._reproject_layers()
-
             print("\n✓ All data loaded successfully!")
 
         except Exception as e:
             print(f"✗ Error loading data: {e}")
             raise
 
-    def _reproject_layers(self):
-        """Ensure all layers use the same coordinate reference system."""
-        base_crs = self.cutting_grid.crs
-
-        layers = [
-            ("tree_mortality", self.tree_mortality),
-            ("community_features", self.community_features),
-            ("egress_routes", self.egress_routes),
-            ("populated_areas", self.populated_areas),
-            ("transmission", self.transmission),
-            ("sub_transmission", self.sub_transmission),
-            ("dist_circuits", self.dist_circuits),
-            ("substations", self.substations),
-            ("pole_top_subs", self.pole_top_subs),
-        ]
-
-        for name, layer in layers:
-            if layer.crs != base_crs:
-                layer = layer.to_crs(base_crs)
-                setattr(self, name, layer)
-                print(f"  Reprojected {name} to {base_crs}")
+    def _read_layer(self, filename, crs=None):
+        """Read a layer, reprojected to crs, reusing the GeoParquet cache if fresh."""
+        path = os.path.join(self.data_dir, filename)
+        stem = os.path.splitext(filename)[0]
+
+        cache_path = None
+        if self.cache_dir is not None:
+            # Keyed by source path, so data dirs sharing a cache never collide
+            source_key = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+            cache_path = os.path.join(
+                self.cache_dir, f"{stem}-{source_key[:12]}.parquet"
+            )
+            # Stale once any of the shapefile's sidecar files is newer
+            source_mtime = max(
+                (
+                    os.path.getmtime(f)
+                    for f in glob.glob(os.path.join(self.data_dir, f"{stem}.*"))
+                ),
+                default=None,
+            )
+            # Without a source, fall through and let read_file report it
+            if (
+                source_mtime is not None
+                and os.path.exists(cache_path)
+                and os.path.getmtime(cache_path) >= source_mtime
+            ):
+                layer = gpd.read_parquet(cache_path)
+                if crs is None or layer.crs == crs:
+                    return layer
+
+        layer = gpd.read_file(path, engine="pyogrio", use_arrow=True)
+        if crs is not None and layer.crs != crs:
+            layer = layer.to_crs(crs)
+            print(f"  Reprojected {stem} to {crs}")
+
+        if cache_path is not None:
+            layer.to_parquet(cache_path)
+        return layer
 
     def _normalize_score(self, values, inverse=False):
         """Normalize values to 0-10 scale."""
-        values = np.array(values, dtype=float)
+        # Private float64 copy, so the arithmetic below can run in place
+        values = np.array(values, dtype=np.float64)
 
         if len(values) == 0 or np.all(np.isnan(values)):
             return np.zeros(len(values))
@@ -171,63 +261,171 @@ class FireCreekAnalysis:
         if max_val == min_val:
             return np.full(len(values), 5.0)
 
+        np.subtract(values, min_val, out=values)
+        np.multiply(values, 10 / (max_val - min_val), out=values)
         if inverse:
-            normalized = 10 - (values - min_val) / (max_val - min_val) * 10
-        else:
-            normalized = (values - min_val) / (max_val - min_val) * 10
+            np.subtract(10, values, out=values)
+
+        return values
+
+    def _find_col(self, df, needles):
+        """Return the first column whose name contains any of the needles."""
+        pattern = re.compile("|".join(map(re.escape, needles)), re.IGNORECASE)
+        return next((col for col in df.columns if pattern.search(col)), None)
+
+    def _numeric_col(self, df, needles, default):
+        """Return a matched column as float64 values, using default for gaps."""
+        col = self._find_col(df, needles)
+        if col is None:
+            return np.full(len(df), default, dtype=np.float64)
+        values = pd.to_numeric(df[col], errors="coerce").fillna(default)
+        return values.to_numpy(dtype=np.float64)
+
+    def _score_task(self, factor):
+        """Return the scoring function and its arguments for one factor.
+
+        Every function takes the cell geometries as its first argument, so the
+        grid can be split into partitions that are scored independently.
+        """
+        cells = self.cutting_grid.geometry.to_numpy()
+
+        if factor == "tree_mortality":
+            # Check for mortality value in different possible column names
+            mortality = self._numeric_col(
+                self.tree_mortality, ("mort", "value", "rate"), default=0
+            )
+            return mortality_scores, (
+                cells,
+                self.tree_mortality.geometry.to_numpy(),
+                mortality,
+            )
+
+        if factor == "community_features":
+            importance = self._numeric_col(
+                self.community_features,
+                ("import", "prior", "weight"),
+                default=10,  # Default high importance
+            )
+            # Within 100 meters, extended to 300 meters
+            return proximity_scores, (
+                cells,
+                self.community_features.geometry.to_numpy(),
+                importance,
+                100,
+                300,
+            )
 
-        return normalized
+        if factor == "egress_routes":
+            priority = self._numeric_col(
+                self.egress_routes,
+                ("prior", "import", "class"),
+                default=10,  # Default high priority
+            )
+            # Within 50 meters (tree fall distance), extended to 150 meters
+            return proximity_scores, (
+                cells,
+                self.egress_routes.geometry.to_numpy(),
+                priority,
+                50,
+                150,
+            )
+
+        if factor == "populated_areas":
+            pop_density = self._numeric_col(
+                self.populated_areas,
+                ("pop", "dens", "people"),
+                default=10,  # Default high density
+            )
+            return population_scores, (
+                cells,
+                self.populated_areas.geometry.to_numpy(),
+                pop_density,
+            )
+
+        if factor == "electric_utilities":
+            # Combine all utility layers into one, each with its base priority
+            utility_layers = [
+                (self.transmission, 10),
+                (self.sub_transmission, 8),
+                (self.dist_circuits, 6),
+                (self.substations, 10),
+                (self.pole_top_subs, 7),
+            ]
+            utilities = np.concatenate(
+                [layer.geometry.to_numpy() for layer, _ in utility_layers]
+            )
+            utility_priority = np.concatenate(
+                [
+                    np.full(len(layer), base_priority, dtype=np.float64)
+                    for layer, base_priority in utility_layers
+                ]
+            )
+            # Within 30 meters (tree fall zone), extended to 100 meters
+            return proximity_scores, (cells, utilities, utility_priority, 30, 100)
+
+        raise ValueError(f"Unknown factor: {factor}")
+
+    def _run_score_task(self, factor):
+        """Compute the raw scores of a single factor in-process."""
+        function, args = self._score_task(factor)
+        return function(*args)
+
+    def calculate_factor_scores(self, n_jobs=None, partition_size=5000):
+        """Calculate all five factor scores in parallel worker processes.
+
+        The factors are independent of each other, so each one is scored in
+        its own process. Grids larger than partition_size cells are also split
+        into spatially compact partitions, each scored against the full layers.
+        Pass n_jobs=1 to score everything sequentially in-process; None or a
+        value below 1 uses all cores.
+        """
+        tasks = {factor: self._score_task(factor) for factor in self.weights}
+
+        n_partitions = -(-len(self.cutting_grid) // partition_size) or 1
+        if n_partitions == 1:
+            partitions = [slice(None)]
+        else:
+            # Hilbert order keeps neighbouring cells in the same partition
+            order = np.argsort(self.cutting_grid.geometry.hilbert_distance().to_numpy())
+            partitions = np.array_split(order, n_partitions)
+
+        # As in joblib, None or values below 1 mean all cores
+        if n_jobs is None or n_jobs < 1:
+            n_jobs = os.cpu_count() or 1
+
+        jobs = [
+            (factor, partition, function, (args[0][partition],) + args[1:])
+            for factor, (function, args) in tasks.items()
+            for partition in partitions
+        ]
 
-    def calculate_tree_mortality_score(self):
+        if n_jobs == 1:
+            results = [function(*args) for _, _, function, args in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=min(n_jobs, len(jobs))) as executor:
+                futures = [
+                    executor.submit(function, *args) for _, _, function, args in jobs
+                ]
+                results = [future.result() for future in futures]
+
+        scores = {factor: np.zeros(len(self.cutting_grid)) for factor in tasks}
+        for (factor, partition, _, _), result in zip(jobs, results):
+            scores[factor][partition] = result
+
+        self.calculate_tree_mortality_score(scores["tree_mortality"])
+        self.calculate_community_score(scores["community_features"])
+        self.calculate_egress_score(scores["egress_routes"])
+        self.calculate_population_score(scores["populated_areas"])
+        self.calculate_utility_score(scores["electric_utilities"])
+
+    def calculate_tree_mortality_score(self, scores=None):
         """Calculate tree mortality score for each grid cell."""
         print("\n" + "=" * 70)
         print("FACTOR 1: TREE MORTALITY SCORE")
         print("=" * 70)
 
-        scores = []
-
-        for idx, grid_cell in self.cutting_grid.iterrows():
-            # Find overlapping mortality areas
-            overlaps = self.tree_mortality[
-                self.tree_mortality.geometry.intersects(grid_cell.geometry)
-            ]
-
-            if len(overlaps) > 0:
-                # Calculate area-weighted mortality
-                total_intersection_area = 0
-                weighted_mortality = 0
-
-                for _, mortality_area in overlaps.iterrows():
-                    intersection = grid_cell.geometry.intersection(
-                        mortality_area.geometry
-                    )
-                    intersection_area = intersection.area
-
-                    # Check for mortality value in different possible column names
-                    mortality_value = 0
-                    for col in mortality_area.index:
-                        if (
-                            "mort" in col.lower()
-                            or "value" in col.lower()
-                            or "rate" in col.lower()
-                        ):
-                            try:
-                                mortality_value = float(mortality_area[col])
-                                break
-                            except:
-                                continue
-
-                    weighted_mortality += mortality_value * intersection_area
-                    total_intersection_area += intersection_area
-
-                if total_intersection_area > 0:
-                    score = weighted_mortality / total_intersection_area
-                else:
-                    score = 0
-            else:
-                score = 0
-
-            scores.append(score)
+        if scores is None:
+            scores = self._run_score_task("tree_mortality")
 
         self.cutting_grid["mortality_score"] = scores
         self.cutting_grid["mortality_score_norm"] = self._normalize_score(scores)
@@ -237,47 +435,14 @@ class FireCreekAnalysis:
         print(f"  Mean: {np.mean(scores):.2f}")
         print(f"  Cells with mortality: {sum(1 for s in scores if s > 0)}")
 
-    def calculate_community_score(self):
+    def calculate_community_score(self, scores=None):
         """Calculate community features proximity score."""
         print("\n" + "=" * 70)
         print("FACTOR 2: COMMUNITY FEATURES SCORE")
         print("=" * 70)
 
-        scores = []
-
-        for idx, grid_cell in self.cutting_grid.iterrows():
-            max_score = 0
-
-            for _, feature in self.community_features.iterrows():
-                distance = grid_cell.geometry.distance(feature.geometry)
-
-                # Get importance weight if available
-                importance = 10  # Default high importance
-                for col in feature.index:
-                    if (
-                        "import" in col.lower()
-                        or "prior" in col.lower()
-                        or "weight" in col.lower()
-                    ):
-                        try:
-                            importance = float(feature[col])
-                            break
-                        except:
-                            continue
-
-                # Distance-based scoring
-                if distance == 0 or grid_cell.geometry.intersects(feature.geometry):
-                    score = importance
-                elif distance < 100:  # Within 100 meters
-                    score = importance * (1 - distance / 100)
-                elif distance < 300:  # Within 300 meters
-                    score = importance * 0.5 * (1 - (distance - 100) / 200)
-                else:
-                    score = 0
-
-                max_score = max(max_score, score)
-
-            scores.append(max_score)
+        if scores is None:
+            scores = self._run_score_task("community_features")
 
         self.cutting_grid["community_score"] = scores
         self.cutting_grid["community_score_norm"] = self._normalize_score(scores)
@@ -287,47 +452,14 @@ class FireCreekAnalysis:
         print(f"  Mean: {np.mean(scores):.2f}")
         print(f"  Cells near features: {sum(1 for s in scores if s > 0)}")
 
-    def calculate_egress_score(self):
+    def calculate_egress_score(self, scores=None):
         """Calculate egress routes proximity score."""
         print("\n" + "=" * 70)
         print("FACTOR 3: EGRESS ROUTES SCORE")
         print("=" * 70)
 
-        scores = []
-
-        for idx, grid_cell in self.cutting_grid.iterrows():
-            max_score = 0
-
-            for _, route in self.egress_routes.iterrows():
-                distance = grid_cell.geometry.distance(route.geometry)
-
-                # Get route priority if available
-                priority = 10  # Default high priority
-                for col in route.index:
-                    if (
-                        "prior" in col.lower()
-                        or "import" in col.lower()
-                        or "class" in col.lower()
-                    ):
-                        try:
-                            priority = float(route[col])
-                            break
-                        except:
-                            continue
-
-                # Distance-based scoring (routes need wider buffer)
-                if distance == 0 or grid_cell.geometry.intersects(route.geometry):
-                    score = priority
-                elif distance < 50:  # Within 50 meters (tree fall distance)
-                    score = priority * (1 - distance / 50)
-                elif distance < 150:  # Extended buffer
-                    score = priority * 0.5 * (1 - (distance - 50) / 100)
-                else:
-                    score = 0
-
-                max_score = max(max_score, score)
-
-            scores.append(max_score)
+        if scores is None:
+            scores = self._run_score_task("egress_routes")
 
         self.cutting_grid["egress_score"] = scores
         self.cutting_grid["egress_score_norm"] = self._normalize_score(scores)
@@ -337,39 +469,14 @@ class FireCreekAnalysis:
         print(f"  Mean: {np.mean(scores):.2f}")
         print(f"  Cells near routes: {sum(1 for s in scores if s > 0)}")
 
-    def calculate_population_score(self):
+    def calculate_population_score(self, scores=None):
         """Calculate populated areas score."""
         print("\n" + "=" * 70)
         print("FACTOR 4: POPULATED AREAS SCORE")
         print("=" * 70)
 
-        scores = []
-
-        for idx, grid_cell in self.cutting_grid.iterrows():
-            total_score = 0
-
-            for _, area in self.populated_areas.iterrows():
-                if grid_cell.geometry.intersects(area.geometry):
-                    intersection = grid_cell.geometry.intersection(area.geometry)
-                    ratio = intersection.area / grid_cell.geometry.area
-
-                    # Get population density if available
-                    pop_density = 10  # Default high density
-                    for col in area.index:
-                        if (
-                            "pop" in col.lower()
-                            or "dens" in col.lower()
-                            or "people" in col.lower()
-                        ):
-                            try:
-                                pop_density = float(area[col])
-                                break
-                            except:
-                                continue
-
-                    total_score += ratio * pop_density
-
-            scores.append(total_score)
+        if scores is None:
+            scores = self._run_score_task("populated_areas")
 
         self.cutting_grid["population_score"] = scores
         self.cutting_grid["population_score_norm"] = self._normalize_score(scores)
@@ -379,43 +486,14 @@ class FireCreekAnalysis:
         print(f"  Mean: {np.mean(scores):.2f}")
         print(f"  Cells in populated areas: {sum(1 for s in scores if s > 0)}")
 
-    def calculate_utility_score(self):
+    def calculate_utility_score(self, scores=None):
         """Calculate electric utilities proximity score."""
         print("\n" + "=" * 70)
         print("FACTOR 5: ELECTRIC UTILITIES SCORE")
         print("=" * 70)
 
-        scores = []
-
-        # Combine all utility layers with different priorities
-        utility_layers = [
-            (self.transmission, 10, "Transmission"),
-            (self.sub_transmission, 8, "Sub-Transmission"),
-            (self.dist_circuits, 6, "Distribution"),
-            (self.substations, 10, "Substations"),
-            (self.pole_top_subs, 7, "Pole-Top Subs"),
-        ]
-
-        for idx, grid_cell in self.cutting_grid.iterrows():
-            max_score = 0
-
-            for utility_layer, base_priority, name in utility_layers:
-                for _, utility in utility_layer.iterrows():
-                    distance = grid_cell.geometry.distance(utility.geometry)
-
-                    # Distance-based scoring (utilities need buffer zones)
-                    if distance == 0 or grid_cell.geometry.intersects(utility.geometry):
-                        score = base_priority
-                    elif distance < 30:  # Within 30 meters (tree fall zone)
-                        score = base_priority * (1 - distance / 30)
-                    elif distance < 100:  # Extended buffer
-                        score = base_priority * 0.5 * (1 - (distance - 30) / 70)
-                    else:
-                        score = 0
-
-                    max_score = max(max_score, score)
-
-            scores.append(max_score)
+        if scores is None:
+            scores = self._run_score_task("electric_utilities")
 
         self.cutting_grid["utility_score"] = scores
         self.cutting_grid["utility_score_norm"] = self._normalize_score(scores)
@@ -435,40 +513,45 @@ class FireCreekAnalysis:
         for factor, weight in self.weights.items():
             print(f"  {factor.replace('_', ' ').title()}: {weight*100:.0f}%")
 
-        # Calculate weighted sum
-        self.cutting_grid["overall_priority"] = (
-            self.cutting_grid["mortality_score_norm"] * self.weights["tree_mortality"]
-            + self.cutting_grid["community_score_norm"]
-            * self.weights["community_features"]
-            + self.cutting_grid["egress_score_norm"] * self.weights["egress_routes"]
-            + self.cutting_grid["population_score_norm"]
-            * self.weights["populated_areas"]
-            + self.cutting_grid["utility_score_norm"]
-            * self.weights["electric_utilities"]
+        # Calculate weighted sum as one (cells x factors) @ (factors,) product
+        factor_columns = {
+            "tree_mortality": "mortality_score_norm",
+            "community_features": "community_score_norm",
+            "egress_routes": "egress_score_norm",
+            "populated_areas": "population_score_norm",
+            "electric_utilities": "utility_score_norm",
+        }
+        factor_scores = self.cutting_grid[list(factor_columns.values())].to_numpy(
+            dtype=np.float64
         )
+        weights = np.array([self.weights[factor] for factor in factor_columns])
+        self.cutting_grid["overall_priority"] = factor_scores @ weights
 
         # Normalize to 0-10 scale
         self.cutting_grid["priority_normalized"] = self._normalize_score(
             self.cutting_grid["overall_priority"]
         )
 
-        # Classify into priority levels
-        self.cutting_grid["priority_class"] = pd.cut(
-            self.cutting_grid["priority_normalized"],
-            bins=[0, 2, 4, 6, 8, 10],
-            labels=["Very Low", "Low", "Medium", "High", "Very High"],
-            include_lowest=True,
-        )
+        priority = self.cutting_grid["priority_normalized"].to_numpy()
 
-        # Rank cells
-        self.cutting_grid["priority_rank"] = (
-            self.cutting_grid["priority_normalized"]
-            .rank(ascending=False, method="dense")
-            .astype(int)
+        # Classify into priority levels (right-closed bins, as with pd.cut)
+        codes = np.digitize(priority, [2, 4, 6, 8], right=True)
+        codes[np.isnan(priority)] = -1
+        self.cutting_grid["priority_class"] = pd.Categorical.from_codes(
+            codes,
+            categories=["Very Low", "Low", "Medium", "High", "Very High"],
+            ordered=True,
         )
 
+        # Rank cells (dense, highest priority first)
+        order = np.argsort(-priority, kind="stable")
+        ranked = priority[order]
+        ranks = np.empty(len(priority), dtype=int)
+        ranks[order] = np.cumsum(np.diff(ranked, prepend=np.nan) != 0)
+        self.cutting_grid["priority_rank"] = ranks
+
         # Results
-        self.results = self.cutting_grid.copy()
+        self.results = self.cutting_grid
 
         print("\nPriority Distribution:")
         for priority in ["Very High", "High", "Medium", "Low", "Very Low"]:
@@ -486,12 +569,12 @@ class FireCreekAnalysis:
 
         # Save as shapefile
         output_shp = os.path.join(self.output_dir, "TreeCuttingPriority.shp")
-        self.results.to_file(output_shp)
+        self.results.to_file(output_shp, engine="pyogrio")
         print(f"✓ Shapefile saved: {output_shp}")
 
         # Save as GeoJSON
         output_geojson = os.path.join(self.output_dir, "TreeCuttingPriority.geojson")
-        self.results.to_file(output_geojson, driver="GeoJSON")
+        self.results.to_file(output_geojson, driver="GeoJSON", engine="pyogrio")
         print(f"✓ GeoJSON saved: {output_geojson}")
 
         # Save summary CSV
@@ -505,17 +588,16 @@ class FireCreekAnalysis:
             "priority_class",
             "priority_rank",
         ]
-        summary_df = self.results[summary_cols].copy()
         summary_path = os.path.join(self.output_dir, "priority_summary.csv")
-        summary_df.to_csv(summary_path, index=False)
+        self.results[summary_cols].to_csv(summary_path, index=False)
         print(f"✓ Summary CSV saved: {summary_path}")
 
         # Save high priority areas only
-        high_priority = self.results[
-            self.results["priority_class"].isin(["Very High", "High"])
-        ].copy()
+        high_priority = (
+            self.results["priority_class"].isin(("Very High", "High")).to_numpy()
+        )
         high_priority_path = os.path.join(self.output_dir, "HighPriorityCells.shp")
-        high_priority.to_file(high_priority_path)
+        self.results.loc[high_priority].to_file(high_priority_path, engine="pyogrio")
         print(f"✓ High priority cells saved: {high_priority_path}")
 
     def create_maps(self):
@@ -528,15 +610,23 @@ class FireCreekAnalysis:
         colors = ["#1a9850", "#91cf60", "#fee08b", "#fc8d59", "#d73027"]
         cmap = LinearSegmentedColormap.from_list("priority", colors, N=256)
 
+        # Tessellate the grid cells once; the vertices are shared across maps
+        parts, cell_of_part = shapely.get_parts(
+            self.results.geometry.to_numpy(), return_index=True
+        )
+        coords, ring_of_coord = shapely.get_coordinates(
+            shapely.get_exterior_ring(parts), return_index=True
+        )
+        vertices = np.split(coords, np.flatnonzero(np.diff(ring_of_coord)) + 1)
+
         # Map 1: Overall Priority
         fig, ax = plt.subplots(1, 1, figsize=(14, 12))
-        self.results.plot(
-            column="priority_normalized",
-            ax=ax,
-            cmap=cmap,
-            legend=True,
-            legend_kwds={"label": "Priority Score (0-10)", "shrink": 0.8},
-        )
+        cells = PolyCollection(vertices, cmap=cmap)
+        cells.set_array(self.results["priority_normalized"].to_numpy()[cell_of_part])
+        ax.add_collection(cells)
+        ax.autoscale_view()
+        ax.set_aspect("equal")
+        fig.colorbar(cells, ax=ax, label="Priority Score (0-10)", shrink=0.8)
         ax.set_title(
             "Fire Creek Tree Cutting Priority Map", fontsize=16, fontweight="bold"
         )
@@ -561,10 +651,23 @@ class FireCreekAnalysis:
             "Very High": "#d73027",
         }
 
-        for priority_class, color in class_colors.items():
-            subset = self.results[self.results["priority_class"] == priority_class]
-            if len(subset) > 0:
-                subset.plot(ax=ax, color=color, edgecolor="gray", linewidth=0.1)
+        face_colors = (
+            self.results["priority_class"]
+            .map(class_colors)
+            .astype(object)
+            .fillna("none")
+            .to_numpy()
+        )
+        ax.add_collection(
+            PolyCollection(
+                vertices,
+                facecolors=face_colors[cell_of_part],
+                edgecolors="gray",
+                linewidths=0.1,
+            )
+        )
+        ax.autoscale_view()
+        ax.set_aspect("equal")
 
         patches = [
             mpatches.Patch(color=color, label=label)
@@ -598,16 +701,42 @@ class FireCreekAnalysis:
             ("priority_normalized", "Overall Priority"),
         ]
 
+        # Rasterize the grid cells once; each factor is then a lookup by cell
+        minx, miny, maxx, maxy = self.results.total_bounds
+        resolution = max((maxx - minx) / 1400, (maxy - miny) / 1200)
+        width = int(np.ceil((maxx - minx) / resolution))
+        height = int(np.ceil((maxy - miny) / resolution))
+        cell_ids = rasterize(
+            zip(self.results.geometry, range(len(self.results))),
+            out_shape=(height, width),
+            transform=from_bounds(minx, miny, maxx, maxy, width, height),
+            fill=-1,
+            dtype="int32",
+        )
+        outside = cell_ids < 0
+
+        # Axis labels from the CRS, as GeoDataFrame.plot would set them
+        crs = self.results.crs
+        if crs:
+            x_label = f"{crs.axis_info[0].name} [{crs.axis_info[0].unit_name}]"
+            y_label = f"{crs.axis_info[1].name} [{crs.axis_info[1].unit_name}]"
+            if crs.axis_info[0].direction == "north":
+                x_label, y_label = y_label, x_label
+        else:
+            x_label, y_label = "x", "y"
+
         for i, (col, title) in enumerate(factors):
-            self.results.plot(
-                column=col,
-                ax=axes[i],
+            values = self.results[col].to_numpy(dtype=float)
+            image = axes[i].imshow(
+                np.ma.masked_where(outside, values[cell_ids]),
                 cmap=cmap,
-                legend=True,
-                legend_kwds={"shrink": 0.6},
+                extent=(minx, maxx, miny, maxy),
             )
+            fig.colorbar(image, ax=axes[i], shrink=0.6)
             axes[i].set_title(title, fontsize=11, fontweight="bold")
             axes[i].grid(True, alpha=0.2)
+            axes[i].set_xlabel(x_label, fontsize="small")
+            axes[i].set_ylabel(y_label, fontsize="small")
 
         plt.suptitle(
             "Fire Creek Tree Cutting Priority - Factor Analysis",
@@ -683,7 +812,7 @@ class FireCreekAnalysis:
             f.write(report_text)
         print(f"\n✓ Report saved: {report_path}")
 
-    def run_analysis(self):
+    def run_analysis(self, n_jobs=None):
         """Run the complete analysis."""
         print("\n" + "=" * 70)
         print("FIRE CREEK TREE CUTTING PRIORITY ANALYSIS")
@@ -691,11 +820,7 @@ class FireCreekAnalysis:
 
         self.load_data()
 
-        self.calculate_tree_mortality_score()
-        self.calculate_community_score()
-        self.calculate_egress_score()
-        self.calculate_population_score()
-        self.calculate_utility_score()
+        self.calculate_factor_scores(n_jobs)
 
         self.calculate_overall_priority()
 
@@ -714,7 +839,8 @@ if __name__ == "__main__":
     project_dir = os.path.dirname(os.path.abspath(__file__))
     data_dir = os.path.join(project_dir, "data")
     output_dir = os.path.join(project_dir, "output")
+    cache_dir = os.path.join(project_dir, "cache")
 
     # Run analysis
-    analysis = FireCreekAnalysis(data_dir, output_dir)
+    analysis = FireCreekAnalysis(data_dir, output_dir, cache_dir)
     analysis.run_analysis()